@@ -1,9 +1,13 @@
 __version__ = "0.7.2"
 
 
-from .mkdefaultwebsite import MkDefaultWebsite
+from typing import TYPE_CHECKING
+
 from . import telemetry
 
+if TYPE_CHECKING:
+    from .mkdefaultwebsite import MkDefaultWebsite
+
 telemetry.setup_logfire()
 
 
@@ -14,4 +18,14 @@ def parse(root, theme, pages):
     return root
 
 
+def __getattr__(name: str):
+    # MkDefaultWebsite imports mknodes, which is expensive to load.
+    if name == "MkDefaultWebsite":
+        from .mkdefaultwebsite import MkDefaultWebsite
+
+        return MkDefaultWebsite
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 __all__ = ["MkDefaultWebsite"]
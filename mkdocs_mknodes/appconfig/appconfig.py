@@ -268,6 +268,13 @@ class AppConfig(ConfigFile):
     """Folder to create the Markdown files in.
 
     If no folder is set, **MkNodes** will generate a temporary dir."""
+    cache_build_folder: bool = False
+    """Keep the build folder between builds if no `build_folder` is set.
+
+    Files which did not change don't get written again on subsequent builds.
+    The folder is shared by all builds of the same config file / build function,
+    so concurrent builds of the same project should not use this setting.
+    Folders which were not used for a week get removed on the next build."""
     show_page_info: bool = True
     """Append an admonition box with build-related information.
 
@@ -305,6 +312,13 @@ class AppConfig(ConfigFile):
 
     This setting can be overridden by setting the page metadata field "render_macros".
     """
+    render_workers: int = Field(1, ge=1)
+    """Amount of threads used for rendering the pages.
+
+    Rendering happens sequentially by default. Using multiple threads can speed up
+    builds containing many nodes which fetch remote data while rendering
+    (like changelogs or dependency tables).
+    """
     global_resources: bool = True
     """Make resources globally available.
 
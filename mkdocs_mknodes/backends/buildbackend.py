@@ -1,11 +1,40 @@
 from __future__ import annotations
 
-from mknodes.utils import log, resources
+import os
+
+from mknodes.utils import log, pathhelpers, resources
+import upath
 
 
 logger = log.get_logger(__name__)
 
 
+def write_file_if_changed(content: str | bytes, path: str | os.PathLike[str]) -> bool:
+    """Write content to given path unless the file already has exactly that content.
+
+    Keeps mtimes of unchanged files stable when re-using a build folder.
+
+    Args:
+        content: Text / bytes to write
+        path: Target path
+
+    Returns:
+        Whether the file was written.
+    """
+    target = upath.UPath(path)
+    try:
+        if isinstance(content, bytes):
+            existing: str | bytes | None = target.read_bytes()
+        else:
+            existing = target.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        existing = None
+    if existing == content:
+        return False
+    pathhelpers.write_file(content, target)
+    return True
+
+
 class BuildBackend:
     def collect(
         self,
@@ -20,6 +20,10 @@ from mkdocs_mknodes.plugin import mkdocsbuilder
 logger = telemetry.get_plugin_logger(__name__)
 
 
+def _to_posix(path: str) -> str:
+    return path.replace("\\", "/") if os.sep == "\\" else path
+
+
 class MkDocsBackend(buildbackend.BuildBackend):
     def __init__(
         self,
@@ -34,20 +38,20 @@ class MkDocsBackend(buildbackend.BuildBackend):
             config: An MkDocs config
             directory: The build directory
         """
-        match config:
-            case mkdocsconfig.Config():
-                self._config = config._config
-            case MkDocsConfig():
-                self._config = config
-            case _:
-                self._config = mkdocsconfig.Config(config)._config
+        if isinstance(config, mkdocsconfig.Config):
+            self._config = config._config
+        elif isinstance(config, MkDocsConfig):
+            self._config = config
+        else:
+            self._config = mkdocsconfig.Config.resolve_config(config)
         self.directory = upath.UPath(directory or ".")
-        files_map = {pathlib.PurePath(f.src_path).as_posix(): f for f in files or []}
+        files_map = {f.src_uri: f for f in files or []}
         self._mk_files: collections.ChainMap[str, files_.File] = collections.ChainMap(
             {},
             files_map,
         )
         self.builder = mkdocsbuilder.MkDocsBuilder(self._config)
+        self._created_dirs: set[pathlib.PurePath] = set()
 
     def _get_parser(self) -> markdown.Markdown:
         """Return a markdown instance based on given config."""
@@ -75,7 +79,7 @@ class MkDocsBackend(buildbackend.BuildBackend):
 
     def write_files(self, files):
         for k, v in files.items():
-            if pathlib.Path(k).name == "SUMMARY.md":
+            if pathlib.PurePath(k).name == "SUMMARY.md":
                 continue
             logger.debug("%s: Writing file to %r", type(self).__name__, str(k))
             self._write_file(k, v)
@@ -85,20 +89,20 @@ class MkDocsBackend(buildbackend.BuildBackend):
             if asset.target_dir == "docs_dir":
                 abs_path = upath.UPath(self._config.docs_dir) / asset.filename
                 logger.info("Writing asset %s...", abs_path)
-                pathhelpers.write_file(asset.content, abs_path)
+                buildbackend.write_file_if_changed(asset.content, abs_path)
             else:
-                path = (pathlib.Path("assets") / asset.filename).as_posix()
+                path = f"assets/{asset.filename}"
                 abs_path = upath.UPath(self._config.site_dir) / path
-                pathhelpers.write_file(asset.content, abs_path)
+                buildbackend.write_file_if_changed(asset.content, abs_path)
 
     def write_css(self, css_files):
         for css in css_files:
             if isinstance(css, resources.CSSText):
-                path = (pathlib.Path("assets") / css.resolved_filename).as_posix()
+                path = f"assets/{css.resolved_filename}"
                 self._config.extra_css.append(path)
                 abs_path = upath.UPath(self._config.site_dir) / path
                 logger.info("Registering css file %s...", abs_path)
-                pathhelpers.write_file(css.content, abs_path)
+                buildbackend.write_file_if_changed(css.content, abs_path)
             else:
                 logger.debug("Adding remote CSS file %s", css)
                 self._config.extra_css.append(str(css))
@@ -114,7 +118,7 @@ class MkDocsBackend(buildbackend.BuildBackend):
 
     def write_js_files(self, js_files):
         for file in js_files:
-            path = (pathlib.Path("assets") / file.resolved_filename).as_posix()
+            path = f"assets/{file.resolved_filename}"
             val = config_options.ExtraScriptValue(str(path))
             val.async_ = file.async_
             val.defer = file.defer
@@ -122,7 +126,7 @@ class MkDocsBackend(buildbackend.BuildBackend):
             self._config.extra_javascript.append(path)
             abs_path = upath.UPath(self._config.site_dir) / path
             logger.info("Registering js file %s...", abs_path)
-            pathhelpers.write_file(file.content, abs_path)
+            buildbackend.write_file_if_changed(file.content, abs_path)
 
     def collect_extensions(self, extensions):
         if extensions:
@@ -140,20 +144,25 @@ class MkDocsBackend(buildbackend.BuildBackend):
             logger.warning("Cannot write template. No custom_dir set in config.")
             return
         path = upath.UPath(self._config.theme.custom_dir)
+        md = self._get_parser()
         for template in templates:
-            md = self._get_parser()
+            md.reset()
             if html := template.build_html(md):
                 target_path = path / template.filename
                 logger.info("Creating %s...", target_path.as_posix())
-                pathhelpers.write_file(html, target_path)
+                buildbackend.write_file_if_changed(html, target_path)
 
     def _write_file(self, path: str | os.PathLike[str], content: str | bytes):
-        path = pathlib.PurePath(path).as_posix()
+        path = _to_posix(os.fspath(path))
         file_for_path = self.builder.get_file(path, src_dir=self.directory)
         new_path = upath.UPath(file_for_path.abs_src_path)
         target_path = None
         if path not in self._mk_files:
-            new_path.parent.mkdir(exist_ok=True, parents=True)
+            # many files share a folder, only create each one once.
+            parent = pathlib.PurePath(file_for_path.abs_src_path).parent
+            if parent not in self._created_dirs:
+                new_path.parent.mkdir(exist_ok=True, parents=True)
+                self._created_dirs.add(parent)
             self._mk_files[path] = file_for_path
             target_path = new_path
 
@@ -163,7 +172,7 @@ class MkDocsBackend(buildbackend.BuildBackend):
             self._mk_files[path] = file_for_path
             pathhelpers.copy(source_path, new_path)
             target_path = new_path
-        pathhelpers.write_file(content, target_path or source_path)
+        buildbackend.write_file_if_changed(content, target_path or source_path)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import collections
+import concurrent.futures
 import itertools
 import pathlib
 import pprint
@@ -16,6 +17,10 @@ from mkdocs_mknodes import buildcontext
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import jinja2
+
     from mkdocs_mknodes.backends import buildbackend
 
 
@@ -56,14 +61,14 @@ def update_page_template(page: mk.MkPage):
         page: Page of the template
     """
     if page.template:
-        node_path = pathlib.Path(page.resolved_file_path)
+        node_path = page.resolved_file_path
     elif any(i.page_template for i in page.parent_navs):
         nav = next(i for i in page.parent_navs if i.page_template)
-        node_path = pathlib.Path(nav.resolved_file_path)
+        node_path = nav.resolved_file_path
     else:
         node_path = None
     if node_path:
-        html_path = node_path.with_suffix(".html").as_posix()
+        html_path = _get_html_path(node_path)
         logger.debug("Updated template for MkPage %r: %r", page.title, html_path)
         page.metadata.template = html_path
         page.template.filename = html_path
@@ -78,8 +83,7 @@ def update_nav_template(nav: mk.MkNav):
         nav: Nav of the template
     """
     if nav.page_template:
-        path = pathlib.Path(nav.resolved_file_path)
-        html_path = path.with_suffix(".html").as_posix()
+        html_path = _get_html_path(nav.resolved_file_path)
         logger.debug("Updated template for MkNav %r: %r", nav.title, html_path)
         nav.metadata.template = html_path
         nav.page_template.filename = html_path
@@ -135,6 +139,34 @@ def process_resources(page: mk.MkPage) -> resources.Resources:
     return req
 
 
+def _contains_jinja_syntax(text: str, env: jinja2.Environment) -> bool:
+    """Check whether given text contains syntax of given jinja environment.
+
+    Text without any jinja syntax does not need to get compiled as a template.
+
+    Args:
+        text: Text to check
+        env: Environment whose syntax to check for
+    """
+    if env.line_statement_prefix or env.line_comment_prefix:
+        return True
+    delimiters = (
+        env.block_start_string,
+        env.variable_start_string,
+        env.comment_start_string,
+    )
+    return any(i in text for i in delimiters)
+
+
+def _get_html_path(path: str) -> str:
+    """Return the template path for given (posix) node file path.
+
+    Args:
+        path: Resolved file path of a node
+    """
+    return pathlib.PurePosixPath(path.replace("\\", "/")).with_suffix(".html").as_posix()
+
+
 def _get_extends_from_parent(node: mk.MkPage | mk.MkNav) -> str | None:
     """Check parent navs for a page template and return its path if one was found.
 
@@ -143,8 +175,7 @@ def _get_extends_from_parent(node: mk.MkPage | mk.MkNav) -> str | None:
     """
     for nav in node.parent_navs:
         if nav.page_template:
-            p = pathlib.Path(nav.resolved_file_path)
-            return p.with_suffix(".html").as_posix()
+            return _get_html_path(nav.resolved_file_path)
     return None
 
 
@@ -157,6 +188,7 @@ class BuildCollector:
         show_page_info: bool = False,
         global_resources: bool = True,
         render_by_default: bool = True,
+        render_workers: int = 1,
     ):
         """Constructor.
 
@@ -166,11 +198,17 @@ class BuildCollector:
             global_resources: If False, make page resources non-global by moving them
                               to the page template blocks
             render_by_default: Whether to resolve all MkPages with their environment
+            render_workers: Amount of threads used to render pages / navs.
+                            Helps for nodes fetching remote data while rendering.
         """
+        if render_workers < 1:
+            msg = f"render_workers needs to be at least 1, got {render_workers}"
+            raise ValueError(msg)
         self.backends = backends
         self.show_page_info = show_page_info
         self.global_resources = global_resources
         self.render_by_default = render_by_default
+        self.render_workers = render_workers
         self.node_files: dict[str, str | bytes] = {}
         self.extra_files: dict[str, str | bytes] = {}
         self.node_counter: collections.Counter[str] = collections.Counter()
@@ -184,8 +222,23 @@ class BuildCollector:
             root: A node to collect build stuff from
             theme: A theme to collect build stuff from.
         """
+        return self.collect_from_nodes(root.iter_nodes(), theme)
+
+    def collect_from_nodes(
+        self,
+        nodes: Iterable[tuple[int, mk.MkNode]],
+        theme: mk.Theme,
+    ):
+        """Collect build stuff from given (level, node) pairs + theme.
+
+        Allows re-using an already materialized tree walk instead of walking again.
+
+        Args:
+            nodes: (level, node) tuples as returned by `MkNode.iter_nodes`
+            theme: A theme to collect build stuff from.
+        """
         logger.debug("Collecting resources...")
-        for _, node in itertools.chain(theme.iter_nodes(), root.iter_nodes()):
+        for _, node in itertools.chain(theme.iter_nodes(), nodes):
             self.node_counter.update([node.__class__.__name__])
             self.extra_files |= node.files
             match node:
@@ -193,12 +246,14 @@ class BuildCollector:
                     self.collect_page(page)
                 case mk.MkNav() as nav:
                     self.collect_nav(nav)
-        for node in self.mapping.values():
-            match node:
-                case mk.MkPage() as page:
-                    self.render_page(page)
-                case mk.MkNav() as nav:
-                    self.render_nav(nav)
+        nodes_to_render = self.mapping.values()
+        if self.render_workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(self.render_workers) as pool:
+                markdown = list(pool.map(self.render_node, nodes_to_render))
+        else:
+            markdown = [self.render_node(node) for node in nodes_to_render]
+        # fill in mapping order, so that the output does not depend on thread timing.
+        self.node_files.update(zip(self.mapping, markdown))
         # theme
         logger.debug("Collecting theme resources...")
         reqs = theme.get_resources()
@@ -247,21 +302,38 @@ class BuildCollector:
         if show_info:
             add_page_info(page, req)
 
+    def render_node(self, node: mk.MkPage | mk.MkNav) -> str:
+        """Convert a page or nav to markdown/HTML.
+
+        Args:
+            node: Page or nav to render.
+
+        Returns:
+            The rendered markdown.
+        """
+        match node:
+            case mk.MkPage() as page:
+                return self.render_page(page)
+            case mk.MkNav() as nav:
+                return self.render_nav(nav)
+
     @logfire.instrument("render_page: {page.title}")
-    def render_page(self, page: mk.MkPage):
+    def render_page(self, page: mk.MkPage) -> str:
         """Convert a page to markdown/HTML.
 
         Args:
             page: Page to render.
+
+        Returns:
+            The rendered markdown.
         """
         md = page.to_markdown()
         do_render = self.render_by_default
         if (render := page.metadata.get("render_macros")) is not None:
             do_render = render
-        if do_render:
+        if do_render and _contains_jinja_syntax(md, page.env):
             md = page.env.render_string(md)
-
-        self.node_files[page.resolved_file_path] = md
+        return md
 
     @logfire.instrument("collect_nav: {nav.title}")
     def collect_nav(self, nav: mk.MkNav):
@@ -278,14 +350,16 @@ class BuildCollector:
         update_nav_template(nav)
 
     @logfire.instrument("render_nav: {nav.title}")
-    def render_nav(self, nav: mk.MkNav):
+    def render_nav(self, nav: mk.MkNav) -> str:
         """Convert a nav to markdown/HTML.
 
         Args:
             nav: Nav to render.
+
+        Returns:
+            The rendered markdown.
         """
-        md = nav.to_markdown()
-        self.node_files[nav.resolved_file_path] = md
+        return nav.to_markdown()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,8 @@
 from __future__ import annotations
 
-import io
 import os
 from typing import Any
 
-import yamling
-
 from mkdocs_mknodes import telemetry
 from mkdocs_mknodes.appconfig import appconfig
 from mkdocs_mknodes.plugin import mknodesconfig
@@ -50,10 +47,12 @@ class ConfigBuilder:
             cfg.remove_plugin("social")
             cfg.remove_plugin("tags")
         # cfg = {**cfg, **kwargs}
-        text = yamling.dump_yaml(cfg.model_dump(mode="json", exclude_none=True))
-        buffer = io.StringIO(text)
-        buffer.name = cfg.config_file_path
-        config = mknodesconfig.MkNodesConfig.from_yaml(buffer, **kwargs)
+        dct = cfg.model_dump(mode="json", exclude_none=True)
+        config = mknodesconfig.MkNodesConfig.from_dict(
+            dct,
+            config_file_path=cfg.config_file_path,
+            **kwargs,
+        )
         if infer_watch_paths:
             watch_paths = [*config.watch, *_infer_watch_paths(config)]
             config.watch = list(set(watch_paths))
@@ -2,13 +2,11 @@ from __future__ import annotations
 
 from collections.abc import Iterator, Mapping
 import contextlib
-from datetime import datetime
 import functools
 import os
 import pathlib
 import sys
 from typing import Any, TextIO
-from urllib import parse
 
 from mknodes.info import contexts
 from mknodes.mdlib import mdconverter
@@ -51,7 +49,7 @@ def _open_config_file(
             path = path.resolve()
             logger.debug("Loading configuration file: %r", path)
             try:
-                result_config_file = open(path, "rb")  # noqa: SIM115, PTH123
+                result_config_file = path.open("rb")
                 break
             except FileNotFoundError:
                 continue
@@ -86,7 +84,7 @@ def load_config(
     Extra kwargs are passed to the configuration to replace any default values
     unless they themselves are None.
     """
-    options = {k: v for k, v in kwargs.copy().items() if v is not None}
+    options = {k: v for k, v in kwargs.items() if v is not None}
     with _open_config_file(config_file) as fd:
         # Initialize the config with the default schema.
 
@@ -122,22 +120,32 @@ class Config:
         Args:
             config: MkDocs config
         """
+        self._config: MkNodesConfig = self.resolve_config(config)
+        self.plugin = self._config.plugins["mknodes"]
+
+    @staticmethod
+    def resolve_config(
+        config: Mapping | str | os.PathLike[str] | None = None,
+    ) -> MkNodesConfig:
+        """Return the MkNodesConfig for given config without creating a wrapper.
+
+        Args:
+            config: MkDocs config, path to a config file or None to search for one
+        """
         match config:
             case MkNodesConfig():
-                self._config: MkNodesConfig = config
+                return config
             case Mapping():
-                self._config = load_config(config)
+                return load_config(config)
             case str() | os.PathLike() as path:
-                self._config = load_config(str(path))
+                return load_config(str(path))
             case None:
                 if file := pathhelpers.find_cfg_for_folder("mkdocs.yml"):
-                    self._config = load_config(str(file))
-                else:
-                    msg = "Could not find config file"
-                    raise FileNotFoundError(msg)
+                    return load_config(str(file))
+                msg = "Could not find config file"
+                raise FileNotFoundError(msg)
             case _:
                 raise TypeError(config)
-        self.plugin = self._config.plugins["mknodes"]
 
     def __getattr__(self, name):
         return getattr(self._config, name)
@@ -161,14 +169,7 @@ class Config:
         return pathlib.Path(self._config.site_dir)
 
     def update_from_context(self, context: contexts.ProjectContext):
-        if not self._config.extra.get("social"):
-            self._config.extra["social"] = context.metadata.social_info
-        self._config.repo_url = context.metadata.repository_url
-        self._config.site_description = context.metadata.summary
-        self._config.site_name = context.metadata.distribution_name
-        self._config.site_author = context.metadata.author_name
-        text = f"Copyright © {datetime.now().year} {context.metadata.author_name}"
-        self._config.copyright = text
+        self._config.update_from_context(context)
 
     def get_markdown_instance(
         self,
@@ -181,11 +182,7 @@ class Config:
             additional_extensions: Additional extensions to use
             config_override: Dict with extension settings. Overrides config settings.
         """
-        extensions = self._config.markdown_extensions
-        if additional_extensions:
-            extensions = list(set(additional_extensions + extensions))
-        configs = self._config.mdx_configs | (config_override or {})
-        return mdconverter.MdConverter(extensions=extensions, extension_configs=configs)
+        return self._config.get_markdown_instance(additional_extensions, config_override)
 
     def get_edit_url(self, edit_path: str | None) -> str | None:
         """Return edit url.
@@ -196,22 +193,7 @@ class Config:
         Args:
             edit_path: Edit path
         """
-        repo_url = self.repo_url
-        if not repo_url:
-            return None
-        edit_uri = self.edit_uri or "edit/main/"
-        if not edit_uri.startswith(("?", "#")) and not repo_url.endswith("/"):
-            repo_url += "/"
-        rel_path = self.build_fn.split(":")[0]
-        if not rel_path.endswith(".py"):
-            rel_path = rel_path.replace(".", "/")
-            rel_path += ".py"
-        base_url = parse.urljoin(repo_url, edit_uri)
-        if repo_url and edit_path:
-            # root_path = pathlib.Path(config["docs_dir"]).parent
-            # edit_path = str(edit_path.relative_to(root_path))
-            rel_path = edit_path
-        return parse.urljoin(base_url, rel_path)
+        return self._config.get_edit_url(edit_path)
 
     def add_js(
         self,
@@ -228,13 +210,7 @@ class Config:
             async_: Add async attribute to <script> tag
             typ: Add given type attribute to <script> tag
         """
-        from mkdocs.config import config_options
-
-        val = config_options.ExtraScriptValue(str(path))
-        val.async_ = async_
-        val.defer = defer
-        val.type = typ
-        self.extra_javascript.append(val)
+        self._config.add_js(path, defer=defer, async_=async_, typ=typ)
 
 
 if __name__ == "__main__":
@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
+import collections
+import functools
+import hashlib
+import os
 import pathlib
-import urllib.parse
+import shutil
 import tempfile
+import time
+import urllib.parse
 from typing import TYPE_CHECKING, Literal
 
 from mkdocs.plugins import BasePlugin
-import mknodes as mk
-from mknodes.info import contexts, folderinfo, linkprovider, reporegistry
-from mknodes.utils import linkreplacer
-
-import jinjarope
 
-from mkdocs_mknodes import buildcollector, mkdocsconfig, telemetry
-from mkdocs_mknodes.backends import markdownbackend, mkdocsbackend
-from mkdocs_mknodes.plugin import mknodesconfig, pluginconfig, rewriteloader
+from mkdocs_mknodes import telemetry
+from mkdocs_mknodes.plugin import pluginconfig
 
 if TYPE_CHECKING:
     import jinja2
@@ -25,6 +25,9 @@ if TYPE_CHECKING:
     from mkdocs.structure.nav import Navigation
     from mkdocs.structure.pages import Page
 
+    from mkdocs_mknodes import mkdocsconfig
+    from mkdocs_mknodes.plugin import linkreplacer, mknodesconfig
+
     # from mkdocs.utils.templates import TemplateContext
 
 
@@ -32,37 +35,132 @@ logger = telemetry.get_plugin_logger(__name__)
 
 CommandStr = Literal["build", "serve", "gh-deploy"]
 
+# cached build folders which were not used for this many seconds get removed.
+_CACHED_BUILD_FOLDER_MAX_AGE = 7 * 24 * 60 * 60
+
+
+@functools.lru_cache(maxsize=4096)
+def _unquote(uri: str) -> str:
+    return urllib.parse.unquote(uri)
+
+
+def _get_cache_root() -> pathlib.Path:
+    return pathlib.Path(tempfile.gettempdir()) / "mknodes_cache"
+
+
+def _evict_cached_build_folders(keep: pathlib.Path):
+    """Remove cached build folders which were not used for a while.
+
+    Folders get touched on every (re)build, so the folder of a concurrent
+    `mkdocs serve` is only removed after it did not rebuild for that long.
+
+    Args:
+        keep: Folder which must not get removed
+    """
+    cutoff = time.time() - _CACHED_BUILD_FOLDER_MAX_AGE
+    try:
+        folders = [i for i in _get_cache_root().iterdir() if i.is_dir()]
+    except OSError:
+        return
+    for folder in folders:
+        try:
+            is_stale = folder.stat().st_mtime < cutoff
+        except OSError:
+            continue
+        if is_stale and folder != keep:
+            logger.debug("Removing cached build folder %s", folder)
+            shutil.rmtree(folder, ignore_errors=True)
+
 
 class MkNodesPlugin(BasePlugin[pluginconfig.PluginConfig]):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.link_replacer = linkreplacer.LinkReplacer()
+        self.link_replacer: linkreplacer.LinkReplacer | None = None
         logger.debug("Finished initializing plugin")
         self.build_folder = None
-        self._dir = None
+        self._dir: tempfile.TemporaryDirectory[str] | None = None
         self.linkprovider = None
         self.theme = None
         self.folderinfo = None
         self.context = None
         self.root = None
+        self._cfg: mkdocsconfig.Config | None = None
+        self._builder = None
+        self._edit_url_cache: dict[str | None, str | None] = {}
+        self._edit_paths: dict[str, str | None] = {}
 
     def on_startup(self, *, command: CommandStr, dirty: bool):
         """Activates new-style MkDocs plugin lifecycle."""
+        self._edit_url_cache.clear()
+        _unquote.cache_clear()
 
-    def on_config(self, config: mknodesconfig.MkNodesConfig):  # type: ignore
-        """Create the project based on MkDocs config."""
+    def _ensure_build_folder(self, config: mknodesconfig.MkNodesConfig):
+        """Set the build folder, creating a temporary one if none is given.
+
+        An existing temporary dir gets re-used on repeated calls (`mkdocs serve`).
+        If `cache_build_folder` is set, a persistent folder keyed by config file and
+        build function is used instead, so that unchanged files don't get written
+        again on subsequent builds.
+
+        Args:
+            config: MkDocs config
+        """
         if config.build_folder:
+            self._cleanup_dir()
             self.build_folder = pathlib.Path(config.build_folder)
-        else:
-            self._dir = tempfile.TemporaryDirectory(
-                prefix="mknodes_",
-                ignore_cleanup_errors=True,
-            )
+            return
+        if config.cache_build_folder:
+            self._cleanup_dir()
+            cfg_path = pathlib.Path(config.config_file_path or "mkdocs.yml").absolute()
+            key_src = f"{cfg_path}:{config.build_fn}"
+            key = hashlib.blake2b(key_src.encode(), digest_size=8).hexdigest()
+            self.build_folder = _get_cache_root() / key
+            self.build_folder.mkdir(parents=True, exist_ok=True)
+            # bump the mtime, eviction only removes folders which were not used lately.
+            self.build_folder.touch()
+            _evict_cached_build_folders(keep=self.build_folder)
+            logger.debug("Using cached build folder %s", self.build_folder)
+            return
+        if self._dir is not None and pathlib.Path(self._dir.name).is_dir():
             self.build_folder = pathlib.Path(self._dir.name)
-            logger.debug("Creating temporary dir %s", self._dir.name)
+            return
+        self._cleanup_dir()
+        self._dir = tempfile.TemporaryDirectory(
+            prefix="mknodes_",
+            ignore_cleanup_errors=True,
+        )
+        self.build_folder = pathlib.Path(self._dir.name)
+        logger.debug("Creating temporary dir %s", self._dir.name)
+
+    def _cleanup_dir(self):
+        if self._dir is not None:
+            self._dir.cleanup()
+            self._dir = None
+
+    def _get_cfg(self, config: mknodesconfig.MkNodesConfig) -> mkdocsconfig.Config:
+        """Return the (cached) config wrapper for given MkDocs config.
+
+        Args:
+            config: MkDocs config to wrap
+        """
+        if self._cfg is None or self._cfg._config is not config:
+            from mkdocs_mknodes import mkdocsconfig
+
+            self._cfg = mkdocsconfig.Config(config)
+            self._edit_url_cache.clear()
+        return self._cfg
 
+    def on_config(self, config: mknodesconfig.MkNodesConfig):  # type: ignore
+        """Create the project based on MkDocs config."""
         if not config.build_fn:
             return
+        self._ensure_build_folder(config)
+        # mknodes pulls in git / theme machinery, only load it when actually needed.
+        import mknodes as mk
+        from mknodes.info import contexts, folderinfo, linkprovider, reporegistry
+
+        self._builder = config.get_builder()
+        self._get_cfg(config)
         self.linkprovider = linkprovider.LinkProvider(
             base_url=config.site_url or "",
             use_directory_urls=config.use_directory_urls,
@@ -72,14 +170,17 @@ class MkNodesPlugin(BasePlugin[pluginconfig.PluginConfig]):
             theme_name=config.theme.name or "material",
             data=dict(config.theme),
         )
-        git_repo = reporegistry.get_repo(
-            str(config.repo_path or "."),
-            clone_depth=config.clone_depth,
-        )
-        self.folderinfo = folderinfo.FolderInfo(git_repo.working_dir)
+        repo_path = str(config.repo_path or ".")
+        # a local checkout can be used as-is, no need to resolve it via the registry.
+        if pathlib.Path(repo_path).joinpath(".git").is_dir():
+            working_dir = str(pathlib.Path(repo_path).absolute())
+        else:
+            repo = reporegistry.get_repo(repo_path, clone_depth=config.clone_depth)
+            working_dir = repo.working_dir
+        info = self.folderinfo = folderinfo.FolderInfo(working_dir)
         self.context = contexts.ProjectContext(
-            metadata=self.folderinfo.context,
-            git=self.folderinfo.git.context,
+            metadata=info.context,
+            git=info.git.context,
             # github=self.folderinfo.github.context,
             theme=self.theme.context,
             links=self.linkprovider,
@@ -98,21 +199,37 @@ class MkNodesPlugin(BasePlugin[pluginconfig.PluginConfig]):
         """
         if not config.build_fn:
             return files
+        import mknodes as mk
+
+        from mkdocs_mknodes import buildcollector
+        from mkdocs_mknodes.backends import markdownbackend, mkdocsbackend
 
         logger.info("Generating pages...")
-        build_fn = config.get_builder()
+        build_fn = self._builder or config.get_builder()
         self.root = mk.MkNav(context=self.context)
         build_fn(theme=self.theme, root=self.root)
         logger.debug("Finished building page.")
-        paths = [
-            pathlib.Path(node.resolved_file_path).stem
-            for _level, node in self.root.iter_nodes()
-            if hasattr(node, "resolved_file_path")
-        ]
+        nodes = list(self.root.iter_nodes())
+        # single pass collecting link excludes and edit paths.
+        splitext, basename = os.path.splitext, os.path.basename
+        paths: list[str] = []
+        edit_paths: dict[str, str | None] = {}
+        for _level, node in nodes:
+            match node:
+                case mk.MkPage():
+                    path = node.resolved_file_path
+                    edit_paths[path] = node._edit_path
+                case mk.MkNav():
+                    path = node.resolved_file_path
+                    edit_paths[path] = None
+                case _:
+                    continue
+            paths.append(splitext(basename(path))[0])
         self.linkprovider.set_excludes(paths)
 
         # now we add our stuff to the MkDocs build environment
-        cfg = mkdocsconfig.Config(config)
+        cfg = self._get_cfg(config)
+        self._edit_url_cache.clear()
 
         logger.info("Updating MkDocs config metadata...")
         cfg.update_from_context(self.root.ctx)
@@ -134,17 +251,18 @@ class MkNodesPlugin(BasePlugin[pluginconfig.PluginConfig]):
             show_page_info=config.show_page_info,
             global_resources=config.global_resources,
             render_by_default=config.render_by_default,
+            render_workers=config.render_workers,
         )
-        self.build_info = collector.collect(self.root, self.theme)
+        self.build_info = collector.collect_from_nodes(nodes, self.theme)
+        mapping = self.build_info.page_mapping
+        self._edit_paths = {k: v for k, v in edit_paths.items() if k in mapping}
         if nav_dict := self.root.nav.to_nav_dict():
-            match config.nav:
-                case list():
-                    for k, v in nav_dict.items():
-                        config.nav.append({k: v})
-                case dict():
-                    config.nav |= nav_dict
-                case None:
-                    config.nav = nav_dict
+            if isinstance(config.nav, list):
+                config.nav.extend({k: v} for k, v in nav_dict.items())
+            elif isinstance(config.nav, dict):
+                config.nav.update(nav_dict)
+            else:
+                config.nav = nav_dict
         return mkdocs_backend.files
 
     def on_nav(
@@ -156,11 +274,18 @@ class MkNodesPlugin(BasePlugin[pluginconfig.PluginConfig]):
         files: Files,
     ) -> Navigation | None:
         """Populate LinkReplacer and build path->MkPage mapping for following steps."""
+        if self.link_replacer is None:
+            from mkdocs_mknodes.plugin import linkreplacer
+
+            self.link_replacer = linkreplacer.LinkReplacer()
+        grouped: dict[str, list[str]] = collections.defaultdict(list)
+        basename = os.path.basename
         for file_ in files:
             assert file_.abs_src_path
-            filename = pathlib.Path(file_.abs_src_path).name
-            url = urllib.parse.unquote(file_.src_uri)
-            self.link_replacer.mapping[filename].append(url)
+            grouped[basename(file_.abs_src_path)].append(_unquote(file_.src_uri))
+        for filename, urls in grouped.items():
+            self.link_replacer.add_urls(filename, urls)
+        self.link_replacer.finalize()
         return nav
 
     def on_env(
@@ -172,6 +297,10 @@ class MkNodesPlugin(BasePlugin[pluginconfig.PluginConfig]):
         files: Files,
     ) -> jinja2.Environment | None:
         """Add our own info to the MkDocs environment."""
+        import jinjarope
+
+        from mkdocs_mknodes.plugin import rewriteloader
+
         rope_env = jinjarope.Environment()
         env.globals["mknodes"] = rope_env.globals
         env.filters |= rope_env.filters
@@ -187,14 +316,22 @@ class MkNodesPlugin(BasePlugin[pluginconfig.PluginConfig]):
         page: Page,
         /,
         *,
-        config: MkDocsConfig,
+        config: mknodesconfig.MkNodesConfig,  # type: ignore
         files: Files,
     ) -> Page | None:
         """During this phase we set the edit paths."""
-        node = self.build_info.page_mapping.get(page.file.src_uri)
-        edit_path = node._edit_path if isinstance(node, mk.MkPage) else None
-        cfg = mkdocsconfig.Config(config)
-        if path := cfg.get_edit_url(edit_path):
+        if not config.build_fn:
+            return page
+        uri = page.file.src_uri
+        if uri not in self._edit_paths:
+            return page
+        edit_path = self._edit_paths[uri]
+        if edit_path in self._edit_url_cache:
+            path = self._edit_url_cache[edit_path]
+        else:
+            cfg = self._get_cfg(config)
+            path = self._edit_url_cache[edit_path] = cfg.get_edit_url(edit_path)
+        if path:
             page.edit_url = path
         return page
 
@@ -208,6 +345,8 @@ class MkNodesPlugin(BasePlugin[pluginconfig.PluginConfig]):
         files: Files,
     ) -> str | None:
         """During this phase links get replaced and `jinja2` stuff get rendered."""
+        if self.link_replacer is None:
+            return markdown
         return self.link_replacer.replace(markdown, page.file.src_uri)
 
     def on_post_build(self, *, config: mknodesconfig.MkNodesConfig) -> None:  # type: ignore
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from mknodes.utils import linkreplacer, log
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = log.get_logger(__name__)
+
+_PERCENT_ESCAPE = re.compile(r"%[0-9A-Fa-f]{2}")
+
+
+class LinkReplacer(linkreplacer.LinkReplacer):
+    """LinkReplacer which skips pages not referencing any known filename."""
+
+    def __init__(self):
+        super().__init__()
+        self._pattern: re.Pattern[str] | None = None
+        self._pattern_names: frozenset[str] = frozenset()
+        self._seen: set[tuple[str, str]] = set()
+
+    def add_urls(self, filename: str, urls: Iterable[str]):
+        """Register urls for given filename, ignoring duplicates.
+
+        Args:
+            filename: Filename which may be used for linking
+            urls: Urls of files with given filename
+        """
+        seen = self._seen
+        new = [i for i in dict.fromkeys(urls) if (filename, i) not in seen]
+        seen.update((filename, i) for i in new)
+        self.mapping[filename].extend(new)
+
+    def finalize(self):
+        """Compile a single pattern matching all filenames of the mapping.
+
+        Needs to be called after the mapping was populated.
+        Longer filenames come first to preserve longest-match semantics.
+        The pattern is only re-compiled if the set of filenames changed.
+        """
+        names = frozenset(self.mapping)
+        if self._pattern is not None and names == self._pattern_names:
+            return
+        ordered = sorted(names, key=len, reverse=True)
+        self._pattern = re.compile("|".join(re.escape(k) for k in ordered))
+        self._pattern_names = names
+        logger.debug("Compiled link pattern for %s filenames", len(names))
+
+    def replace(self, markdown: str, src_uri: str) -> str:
+        # links may be percent-encoded, those always take the full path.
+        if (
+            self._pattern is not None
+            and not self._pattern.search(markdown)
+            and ("%" not in markdown or not _PERCENT_ESCAPE.search(markdown))
+        ):
+            return markdown
+        return super().replace(markdown, src_uri)
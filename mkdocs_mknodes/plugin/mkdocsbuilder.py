@@ -24,10 +24,13 @@ class MkDocsPage(pages.Page):
         super().__init__(title=self.mkpage.title, file=file, config=config)
 
     def read_source(self, config: MkDocsConfig):
+        # metadata is passed to MkDocs via self.meta, so render the page without it.
         self.meta = self.mkpage.metadata
         self.mkpage.metadata = {}
-        self.markdown = str(self.mkpage)
-        self.mkpage.metadata = self.meta
+        try:
+            self.markdown = str(self.mkpage)
+        finally:
+            self.mkpage.metadata = self.meta
 
 
 class MkDocsBuilder:
@@ -44,13 +47,12 @@ class MkDocsBuilder:
         Args:
             config: MkDocs Config
         """
-        match config:
-            case mkdocsconfig.Config():
-                self._config = config._config
-            case MkNodesConfig():
-                self._config = config
-            case _:
-                self._config = mkdocsconfig.Config(config)._config
+        if isinstance(config, mkdocsconfig.Config):
+            self._config = config._config
+        elif isinstance(config, MkNodesConfig):
+            self._config = config
+        else:
+            self._config = mkdocsconfig.Config.resolve_config(config)
         self.mk_files = files_.Files([])
 
     def get_file(
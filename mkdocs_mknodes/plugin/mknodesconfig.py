@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterator
 import contextlib
-from datetime import datetime
+import copy
 import functools
 import io
 import logging
 import os
 import pathlib
 import sys
+import time
 from typing import Any, Self, TextIO
 from urllib import parse
 
@@ -26,6 +27,92 @@ import yamling
 logger = logging.getLogger(__name__)
 
 
+def _freeze(obj: Any) -> Any:
+    """Return a hashable representation of given (nested) config data.
+
+    Raises:
+        TypeError: If the data contains unhashable objects
+    """
+    match obj:
+        case dict():
+            return tuple(sorted((k, _freeze(v)) for k, v in obj.items()))
+        case list() | tuple():
+            return tuple(_freeze(i) for i in obj)
+        case set():
+            return frozenset(_freeze(i) for i in obj)
+        case _:
+            hash(obj)
+            return obj
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(data: bytes) -> Any:
+    return yamling.load_yaml(io.BytesIO(data), resolve_inherit=True)
+
+
+def _load_yaml(fd: TextIO) -> Any:
+    """Parse YAML from given file descriptor, re-using results for identical content.
+
+    Returns a copy of the cached data since the configs get mutated later on.
+    Files using INHERIT or custom tags (like `!ENV` or includes) are not cached
+    since their result does not only depend on the file content.
+
+    Args:
+        fd: Open (binary / text) file descriptor to parse
+    """
+    if not fd.seekable():
+        return yamling.load_yaml(fd, resolve_inherit=True)
+    content = fd.read()
+    data = content.encode() if isinstance(content, str) else content
+    fd.seek(0)
+    if b"INHERIT" in data or b"!" in data:
+        return yamling.load_yaml(fd, resolve_inherit=True)
+    return copy.deepcopy(_parse_yaml(data))
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_callable(spec: str, mtime_ns: int | None) -> Callable[..., Any]:
+    """Resolve given build_fn spec, cached by spec and build script mtime.
+
+    Args:
+        spec: Build function spec (`module:fn` or `path/to/file.py:fn`)
+        mtime_ns: Modification time of the build script (None for module specs)
+    """
+    return classhelpers.to_callable(spec)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_docs_loader(docs_dir: str) -> jinjarope.FileSystemLoader:
+    """Return a (shared) FileSystemLoader for given docs dir.
+
+    Args:
+        docs_dir: Docs dir to load templates from
+    """
+    return jinjarope.FileSystemLoader(docs_dir)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_edit_url_base(
+    repo_url: str,
+    edit_uri: str | None,
+    build_fn: str,
+) -> tuple[str, str]:
+    """Return the edit base url and the edit path of the build function.
+
+    Args:
+        repo_url: Repository url
+        edit_uri: Edit uri relative to the repository url
+        build_fn: Build function path (`module:fn` or `path/to/file.py:fn`)
+    """
+    edit_uri = edit_uri or "edit/main/"
+    if not edit_uri.startswith(("?", "#")) and not repo_url.endswith("/"):
+        repo_url += "/"
+    rel_path = build_fn.rpartition(":")[0]
+    if not rel_path.endswith(".py"):
+        rel_path = rel_path.replace(".", "/") + ".py"
+    return parse.urljoin(repo_url, edit_uri), rel_path
+
+
 @contextlib.contextmanager
 def _open_config_file(
     config_file: str | os.PathLike[str] | TextIO | None,
@@ -68,9 +155,27 @@ def _open_config_file(
             result_config_file.close()
 
 
+class _PositiveInt(c.Type[int]):
+    """Integer option which needs to be at least 1."""
+
+    def __init__(self, default: int | None = None):
+        super().__init__(int, default=default)
+
+    def run_validation(self, value: object) -> int:
+        value = super().run_validation(value)
+        if value < 1:
+            msg = f"Expected a value >= 1, got {value}"
+            raise c.ValidationError(msg)
+        return value
+
+
 class MkNodesConfig(defaults.MkDocsConfig):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._jinja_cfg_cache: tuple[Any, jinjarope.EnvConfig] | None = None
+        self._applied_context: contexts.ProjectContext | None = None
+
     @classmethod
-    @functools.cache
     def from_yaml(
         cls,
         config_file: str | TextIO | None = None,
@@ -87,15 +192,35 @@ class MkNodesConfig(defaults.MkDocsConfig):
         Extra kwargs are passed to the configuration to replace any default values
         unless they themselves are None.
         """
-        options = {k: v for k, v in kwargs.copy().items() if v is not None}
         with _open_config_file(config_file) as fd:
-            # Initialize the config with the default schema.
-
             if config_file_path is None and fd is not sys.stdin.buffer:
                 config_file_path = getattr(fd, "name", None)
-            cfg = cls(config_file_path=config_file_path)
-            dct = yamling.load_yaml(fd, resolve_inherit=True)
-            cfg.update(dct)
+            dct = _load_yaml(fd)
+        return cls.from_dict(
+            dct,
+            config_file_path=config_file_path,
+            validate=validate,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        dct: dict[str, Any],
+        *,
+        config_file_path: str | None = None,
+        validate: bool = True,
+        **kwargs: Any,
+    ) -> Self:
+        """Load the configuration from an already parsed dictionary.
+
+        Extra kwargs are passed to the configuration to replace any default values
+        unless they themselves are None.
+        """
+        options = {k: v for k, v in kwargs.items() if v is not None}
+        # Initialize the config with the default schema.
+        cfg = cls(config_file_path=config_file_path)
+        cfg.update(dct)
         # Then load the options to overwrite anything in the config.
         cfg.update(options)
         if validate:
@@ -121,9 +246,8 @@ class MkNodesConfig(defaults.MkDocsConfig):
         validate: bool = True,
     ) -> Self:
         # cfg = yamling.load_yaml_file(file, resolve_inherit=True)
-        config_str = upath.UPath(file).read_text()
-        str_io = io.StringIO(config_str)
-        return cls.from_yaml(str_io, config_file_path=config_file_path, validate=validate)
+        with upath.UPath(file).open("rb") as fd:
+            return cls.from_yaml(fd, config_file_path=config_file_path, validate=validate)
 
     build_fn = c.Type(str, default="mkdocs_mknodes:parse")
     """Path to the build script / callable.
@@ -151,6 +275,13 @@ class MkNodesConfig(defaults.MkDocsConfig):
     """Folder to create the Markdown files in.
 
     If no folder is set, **MkNodes** will generate a temporary dir."""
+    cache_build_folder = c.Type(bool, default=False)
+    """Keep the build folder between builds if no `build_folder` is set.
+
+    Files which did not change don't get written again on subsequent builds.
+    The folder is shared by all builds of the same config file / build function,
+    so concurrent builds of the same project should not use this setting.
+    Folders which were not used for a week get removed on the next build."""
     show_page_info = c.Type(bool, default=False)
     """Append an admonition box with build-related information.
 
@@ -188,6 +319,13 @@ class MkNodesConfig(defaults.MkDocsConfig):
 
     This setting can be overridden by setting the page metadata field "render_macros".
     """
+    render_workers = _PositiveInt(default=1)
+    """Amount of threads used for rendering the pages.
+
+    Rendering happens sequentially by default. Using multiple threads can speed up
+    builds containing many nodes which fetch remote data while rendering
+    (like changelogs or dependency tables).
+    """
     global_resources = c.Type(bool, default=True)
     """Make resources globally available.
 
@@ -237,11 +375,34 @@ class MkNodesConfig(defaults.MkDocsConfig):
     # """Jinja undefined macro behavior."""
 
     def get_builder(self) -> Callable[..., Any]:
-        build_fn = classhelpers.to_callable(self.build_fn)
+        # rpartition, so that windows drive letters stay part of the path.
+        file_path = self.build_fn.rpartition(":")[0]
+        if not file_path.endswith(".py"):
+            build_fn = _resolve_callable(self.build_fn, None)
+        else:
+            # build scripts get executed again when they changed.
+            try:
+                mtime = pathlib.Path(file_path).stat().st_mtime_ns
+            except (OSError, ValueError):
+                build_fn = classhelpers.to_callable(self.build_fn)
+            else:
+                build_fn = _resolve_callable(self.build_fn, mtime)
         build_kwargs = self.build_kwargs or {}
         return functools.partial(build_fn, **build_kwargs)
 
     def get_jinja_config(self) -> jinjarope.EnvConfig:
+        """Return the jinja EnvConfig for this config.
+
+        The EnvConfig (including its loaders) is cached as long as the jinja config
+        and the docs dir stay the same.
+        """
+        try:
+            key = (_freeze(self.jinja_config), self.docs_dir)
+        except TypeError:
+            key = None
+        if key is not None and self._jinja_cfg_cache and self._jinja_cfg_cache[0] == key:
+            return self._jinja_cfg_cache[1]
+        loaders = self.jinja_config.get("jinja_loaders")
         cfg = jinjarope.EnvConfig(
             block_start_string=self.jinja_config.get("jinja_block_start_string") or "{%",
             block_end_string=self.jinja_config.get("jinja_block_end_string") or "%}",
@@ -250,13 +411,15 @@ class MkNodesConfig(defaults.MkDocsConfig):
             variable_end_string=self.jinja_config.get("jinja_variable_end_string")
             or r"}}",
             # undefined=self.jinja_config.get("jinja_on_undefined"),
-            loader=jinjarope.loaders.from_json(self.jinja_config.get("jinja_loaders")),
+            loader=jinjarope.loaders.from_json(loaders) if loaders else None,
         )
-        docs_loader = jinjarope.FileSystemLoader(self.docs_dir)
+        docs_loader = _get_docs_loader(self.docs_dir)
         if cfg.loader:
             cfg.loader |= docs_loader  # type: ignore
         else:
             cfg.loader = docs_loader
+        if key is not None:
+            self._jinja_cfg_cache = (key, cfg)
         return cfg
 
     # @property
@@ -275,14 +438,24 @@ class MkNodesConfig(defaults.MkDocsConfig):
     #     return pathlib.Path(super().site_dir)
 
     def update_from_context(self, context: contexts.ProjectContext):
-        if not super().extra.get("social"):
-            super().extra["social"] = context.metadata.social_info
-        super().repo_url = context.metadata.repository_url
-        super().site_description = context.metadata.summary
-        super().site_name = context.metadata.distribution_name
-        super().site_author = context.metadata.author_name
-        text = f"Copyright © {datetime.now().year} {context.metadata.author_name}"
-        super().copyright = text
+        """Update config fields with data from given context.
+
+        Does nothing if the same context was already applied.
+
+        Args:
+            context: Project context to take the metadata from
+        """
+        if self._applied_context is context:
+            return
+        self._applied_context = context
+        if not self.extra.get("social"):
+            self.extra["social"] = context.metadata.social_info
+        self.repo_url = context.metadata.repository_url
+        self.site_description = context.metadata.summary
+        self.site_name = context.metadata.distribution_name
+        self.site_author = context.metadata.author_name
+        text = f"Copyright © {time.localtime().tm_year} {context.metadata.author_name}"
+        self.copyright = text
 
     def get_markdown_instance(
         self,
@@ -297,8 +470,11 @@ class MkNodesConfig(defaults.MkDocsConfig):
         """
         extensions = super().markdown_extensions
         if additional_extensions:
-            extensions = list(set(additional_extensions + extensions))
-        configs = super().mdx_configs | (config_override or {})
+            # keep order, extension order affects processor priorities.
+            extensions = list(dict.fromkeys([*extensions, *additional_extensions]))
+        configs = super().mdx_configs
+        if config_override:
+            configs = configs | config_override
         return mdconverter.MdConverter(extensions=extensions, extension_configs=configs)
 
     def get_edit_url(self, edit_path: str | None) -> str | None:
@@ -310,22 +486,16 @@ class MkNodesConfig(defaults.MkDocsConfig):
         Args:
             edit_path: Edit path
         """
-        repo_url = self.repo_url
-        if not repo_url:
+        if not self.repo_url:
             return None
-        edit_uri = self.edit_uri or "edit/main/"
-        if not edit_uri.startswith(("?", "#")) and not repo_url.endswith("/"):
-            repo_url += "/"
-        rel_path = self.build_fn.split(":")[0]
-        if not rel_path.endswith(".py"):
-            rel_path = rel_path.replace(".", "/")
-            rel_path += ".py"
-        base_url = parse.urljoin(repo_url, edit_uri)
-        if repo_url and edit_path:
-            # root_path = pathlib.Path(config["docs_dir"]).parent
-            # edit_path = str(edit_path.relative_to(root_path))
-            rel_path = edit_path
-        return parse.urljoin(base_url, rel_path)
+        base_url, build_fn_path = _get_edit_url_base(
+            self.repo_url,
+            self.edit_uri,
+            self.build_fn,
+        )
+        # root_path = pathlib.Path(config["docs_dir"]).parent
+        # edit_path = str(edit_path.relative_to(root_path))
+        return parse.urljoin(base_url, edit_path or build_fn_path)
 
     def add_js(
         self,
@@ -342,9 +512,7 @@ class MkNodesConfig(defaults.MkDocsConfig):
             async_: Add async attribute to <script> tag
             typ: Add given type attribute to <script> tag
         """
-        from mkdocs.config import config_options
-
-        val = config_options.ExtraScriptValue(str(path))
+        val = c.ExtraScriptValue(str(path))
         val.async_ = async_
         val.defer = defer
         val.type = typ
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import re
 
 from mknodes.utils import log
@@ -25,29 +26,51 @@ MKDOCS_TOC_AFTER = """\
 """  # noqa: E501
 
 
+_NAV_ITEM_RE = re.compile(
+    r'{% set (is_expanded|sections) = "navigation\.(expand|sections)" in features %}'
+)
+_NAV_ITEM_META_KEYS = {"is_expanded": "nav_expanded", "sections": "nav_sections"}
+
+
+def _extend_nav_item_flag(match: re.Match[str]) -> str:
+    var, feature = match.groups()
+    key = _NAV_ITEM_META_KEYS[var]
+    return (
+        f'{{% set {var} = "navigation.{feature}" in features or (page and page.meta'
+        f" and page.meta.{key}) %}}"
+    )
+
+
+_ICON_INCLUDE_RE = re.compile(r"{% include \"\.icons/\" ~ (.*) ~ \"\.svg\" %}")
+
+
+def _rewrite_mkdocs_base(path: str, src: str) -> str:
+    if not path.endswith("mkdocs/themes/mkdocs/base.html"):
+        return src
+    return src.replace(MKDOCS_TOC_PRE, MKDOCS_TOC_AFTER)
+
+
+def _rewrite_nav_item(path: str, src: str) -> str:
+    if not path.endswith("/material/templates/partials/nav-item.html"):
+        return src
+    return _NAV_ITEM_RE.sub(_extend_nav_item_flag, src)
+
+
+# keyed by file name, the rewriters check the full path themselves.
+_REWRITERS = {"base.html": _rewrite_mkdocs_base, "nav-item.html": _rewrite_nav_item}
+
+
 def rewrite(path, src):
-    if path.endswith("mkdocs/themes/mkdocs/base.html"):
-        logger.debug("Modifying %r", path)
-        src = src.replace(MKDOCS_TOC_PRE, MKDOCS_TOC_AFTER)
-    if path.endswith("/material/templates/partials/nav-item.html"):
-        logger.debug("Modifying %r", path)
-        src = src.replace(
-            r'{% set is_expanded = "navigation.expand" in features %}',
-            r'{% set is_expanded = "navigation.expand" in features or (page and page.meta'
-            r" and page.meta.nav_expanded) %}",
-        )
-        src = src.replace(
-            r'{% set sections = "navigation.sections" in features %}',
-            r'{% set sections = "navigation.sections" in features or (page and page.meta'
-            r" and page.meta.nav_sections) %}",
-        )
-    if "/material/templates/" in path:
+    is_material = "/material/templates/" in path
+    rewriter = _REWRITERS.get(path.rpartition("/")[2])
+    if rewriter is None and not is_material:
+        return src
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug("Modifying %r", path)
-        return re.sub(
-            r"{% include \"\.icons/\" ~ (.*) ~ \"\.svg\" %}",
-            r"{{ \g<1> | get_icon_svg }}",
-            src,
-        )
+    if rewriter is not None:
+        src = rewriter(path, src)
+    if is_material:
+        return _ICON_INCLUDE_RE.sub(r"{{ \g<1> | get_icon_svg }}", src)
         # return re.sub(
         #     r"{% import \"\.icons/\" ~ (.*) ~ \"\.svg\" as (.*) %}",
         #     r"{% set \g<2> = \g<1> | get_icon_svg %}",
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import MutableMapping
 import logging
+import os
 from typing import Any
 
 import logfire
@@ -13,15 +14,22 @@ import logfire
 # from opentelemetry.instrumentation.urllib import URLLibInstrumentor
 
 
+_CODE_SOURCE = logfire.CodeSource(
+    repository="https://github.com/phil65/mkdocs_mknodes",
+    revision="main",
+    root_path=".",
+)
+
+
 def setup_logfire():
-    code_source = logfire.CodeSource(
-        repository="https://github.com/phil65/mkdocs_mknodes",
-        revision="main",
-        root_path=".",
-    )
+    """Configure logfire.
+
+    HTTP client and system metrics instrumentation is only enabled if the
+    `MKNODES_LOGFIRE` environment variable is set to `1`.
+    """
     # console_opts = logfire.ConsoleOptions()
     logfire.configure(
-        code_source=code_source,
+        code_source=_CODE_SOURCE,
         console=False,
         send_to_logfire="if-token-present",
         service_name="mkdocs-mknodes",
@@ -36,9 +44,11 @@ def setup_logfire():
     # SQLite3Instrumentor().instrument()
     # URLLib3Instrumentor().instrument()
     # URLLibInstrumentor().instrument()
-    logfire.instrument_requests()
-    logfire.instrument_system_metrics()
-    logfire.instrument_aiohttp_client()
+    # instrumentation patches HTTP clients and starts metric threads, so opt-in only.
+    if os.environ.get("MKNODES_LOGFIRE") == "1":
+        logfire.instrument_requests()
+        logfire.instrument_system_metrics()
+        logfire.instrument_aiohttp_client()
     # logfire.instrument_httpx()
     # logfire.install_auto_tracing("mkdocs")
 
@@ -46,6 +56,9 @@ def setup_logfire():
     # litellm.callbacks = ["logfire"]
 
 
+_handler = logfire.LogfireLoggingHandler()
+
+
 class PrefixedLogger(logging.LoggerAdapter):
     """A logger adapter to prefix log messages."""
 
@@ -58,6 +71,7 @@ class PrefixedLogger(logging.LoggerAdapter):
         """
         super().__init__(logger, {})
         self.prefix = prefix
+        self._prefix = f"{prefix}: "
 
     def process(self, msg: str, kwargs: MutableMapping[str, Any]) -> tuple[str, Any]:
         """Process the message.
@@ -69,7 +83,7 @@ class PrefixedLogger(logging.LoggerAdapter):
         Returns:
             The processed message.
         """
-        return f"{self.prefix}: {msg}", kwargs
+        return f"{self._prefix}{msg}", kwargs
 
 
 def get_plugin_logger(name: str) -> PrefixedLogger:
@@ -91,5 +105,6 @@ def get_plugin_logger(name: str) -> PrefixedLogger:
         ```
     """
     logger = logging.getLogger(f"mkdocs.plugins.{name}")
-    logger.addHandler(logfire.LogfireLoggingHandler())
+    # addHandler ignores handlers which are already attached.
+    logger.addHandler(_handler)
     return PrefixedLogger(name.split(".", 1)[0], logger)
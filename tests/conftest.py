@@ -2,9 +2,27 @@ from __future__ import annotations
 
 import pytest
 
-from mkdocs_mknodes import mkdocsconfig
+
+# heavy imports happen inside the fixtures, so that only requested ones pay for them.
 
 
 @pytest.fixture(scope="session")
 def config():
+    from mkdocs_mknodes import mkdocsconfig
+
     return mkdocsconfig.Config()
+
+
+# function scope, BuildCollector.collect() registers templates on the theme.
+@pytest.fixture
+def material_theme():
+    import mknodes as mk
+
+    return mk.MaterialTheme()
+
+
+@pytest.fixture(scope="module")
+def runner():
+    from typer.testing import CliRunner
+
+    return CliRunner()
@@ -1,38 +1,67 @@
 from __future__ import annotations
 
-import pathlib
-import tempfile
+from unittest import mock
 
 import mknodes as mk
+from mknodes.utils import resources
 import pytest
 
 from mkdocs_mknodes import buildcollector, mkdocsconfig
-from mkdocs_mknodes.backends import markdownbackend, mkdocsbackend
+from mkdocs_mknodes.backends import buildbackend, mkdocsbackend
 
 
-_dir = tempfile.TemporaryDirectory(prefix="mknodes_")
-build_folder = pathlib.Path(_dir.name)
+class DictBackend(buildbackend.BuildBackend):
+    """Backend keeping written files in memory."""
 
+    def __init__(self):
+        self.files: dict[str, str | bytes] = {}
 
-def test_build():
+    def write_files(self, files: dict[str, str | bytes]):
+        self.files.update(files)
+
+
+def test_build(tmp_path, material_theme):
     nav = mk.MkNav.with_context("Test")
     cfg = mkdocsconfig.Config()
     cfg.update_from_context(nav.ctx)
     mkdocs_backend = mkdocsbackend.MkDocsBackend(
         config=cfg,
-        directory=build_folder,
-    )
-
-    markdown_backend = markdownbackend.MarkdownBackend(
-        directory=pathlib.Path(cfg.site_dir) / "src",
-        extension=".original",
+        directory=tmp_path,
     )
+    dict_backend = DictBackend()
     collector = buildcollector.BuildCollector(
-        backends=[mkdocs_backend, markdown_backend],
+        backends=[mkdocs_backend, dict_backend],
         show_page_info=True,
     )
-    build_info = collector.collect(nav, mk.MaterialTheme())
+    build_info = collector.collect(nav, material_theme)
     assert build_info
+    assert dict_backend.files.keys() == build_info.build_files.keys()
+
+
+def _collect_files(render_workers: int) -> dict[str, str | bytes]:
+    nav = mk.MkNav.with_context("Test")
+    for i in range(8):
+        page = mk.MkPage(f"Page {i}")
+        page += f"Content of page {i}."
+        nav += page
+    backend = DictBackend()
+    collector = buildcollector.BuildCollector(
+        backends=[backend],
+        render_workers=render_workers,
+    )
+    collector.collect(nav, mk.MaterialTheme())
+    return backend.files
+
+
+def test_render_workers():
+    # same call site for both builds, nodes record the line they were created from.
+    sequential, threaded = (_collect_files(render_workers=i) for i in (1, 4))
+    assert list(threaded.items()) == list(sequential.items())
+
+
+def test_render_workers_validation():
+    with pytest.raises(ValueError, match="render_workers"):
+        buildcollector.BuildCollector(backends=[], render_workers=0)
 
 
 def build(project):
@@ -42,17 +71,23 @@ def build(project):
     project.root += sub_nav
 
 
-def test_templates():
-    theme = mk.MaterialTheme()
+def test_templates(tmp_path):
+    # the collector only needs a few theme hooks, no need to load real templates.
+    theme = mock.create_autospec(mk.MaterialTheme, instance=True)
+    theme.iter_nodes.return_value = iter([])
+    theme.get_resources.return_value = resources.Resources()
+    theme.templates = []
     nav = mk.MkNav.with_context(repo_url=".")
     cfg = mkdocsconfig.Config()
     cfg.update_from_context(nav.ctx)
     mkdocs_backend = mkdocsbackend.MkDocsBackend(
         config=cfg,
-        directory=build_folder,
+        directory=tmp_path,
     )
     collector = buildcollector.BuildCollector(backends=[mkdocs_backend])
     collector.collect(nav, theme)
+    theme.get_resources.assert_called_once_with()
+    theme.adapt_extensions.assert_called_once()
     # assert len(build_info.templates) == 1
 
 
@@ -1,63 +1,75 @@
 from __future__ import annotations
 
-import pathlib
-import tempfile
 from unittest import mock
 
 import pytest
-from typer.testing import CliRunner
 
 from mkdocs_mknodes import cli
 
 
-_dir = tempfile.TemporaryDirectory(prefix="mknodes_")
-build_folder = pathlib.Path(_dir.name)
+BUILD_FN = "mkdocs_mknodes:MkDefaultWebsite"
+DEFAULT_KWARGS = dict(
+    config_path="mkdocs.yml",
+    repo_path=None,
+    build_fn=None,
+    clone_depth=None,
+    site_dir="site",
+    strict=False,
+    theme=None,
+    use_directory_urls=True,
+)
 
 
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        ([], {}),
+        (
+            ["--config-path", "mkdocs.yml", "--build-fn", BUILD_FN],
+            {"build_fn": BUILD_FN},
+        ),
+        (
+            ["-t", "mkdocs", "-s", "--no-directory-urls", "-d", "out"],
+            {
+                "theme": "mkdocs",
+                "strict": True,
+                "use_directory_urls": False,
+                "site_dir": "out",
+            },
+        ),
+    ],
+)
 @mock.patch("mkdocs_mknodes.commands.build_page.build", autospec=True)
-def test_build(mock_build):
-    build_fn = "mkdocs_mknodes:MkDefaultWebsite"
-    cfg_file = "mkdocs.yml"
-    runner = CliRunner()
-    result = runner.invoke(
-        cli.cli,
-        ["build", "--config-path", cfg_file, "--build-fn", build_fn],
-        catch_exceptions=False,
-    )
+def test_build(mock_build, runner, args, expected):
+    result = runner.invoke(cli.cli, ["build", *args], catch_exceptions=False)
 
     assert result.exit_code == 0
-    mock_build.assert_called_once_with(
-        config_path=cfg_file,
-        repo_path=None,
-        build_fn=build_fn,
-        clone_depth=None,
-        site_dir="site",
-        strict=False,
-        theme=None,
-        use_directory_urls=True,
-    )
+    mock_build.assert_called_once()
+    assert mock_build.call_args.kwargs == DEFAULT_KWARGS | expected
 
 
 @mock.patch("mkdocs_mknodes.liveserver.LiveServer.serve", autospec=True)
 @mock.patch("mkdocs_mknodes.commands.build_page._build", autospec=True)
 def test_serve_default(mock_build, mock_serve):
-    runner = CliRunner()
-    result = runner.invoke(
-        cli.cli,
-        ["serve", "--config-path", "configs/mkdocs_mkdocs.yml"],
-        catch_exceptions=False,
+    # typer returns the plain function, call it directly to skip argument parsing.
+    cli.serve(
+        repo_path=None,
+        build_fn=None,
+        clone_depth=None,
+        config_path="configs/mkdocs_mkdocs.yml",
+        strict=False,
+        theme="material",
+        use_directory_urls=True,
+        _verbose=False,
+        _quiet=False,
     )
-
-    assert result.exit_code == 0
     mock_build.assert_called_once()
 
 
-# def test_create_config():
-#     build_fn = "mkdocs_mknodes:MkDefaultWebsite"
-#     runner = CliRunner()
+# def test_create_config(runner):
 #     result = runner.invoke(
 #         cli.cli,
-#         ["create-config", "--build-fn", build_fn],
+#         ["create-config", "--build-fn", BUILD_FN],
 #         catch_exceptions=False,
 #     )
 #     assert result.exit_code == 0